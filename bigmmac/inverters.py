@@ -13,13 +13,16 @@ class FullBridgeIdeal:
         self.vout = 0
         self.fswitch = fsw
         self.time = 0
+        self.dt = None
+        self.steps = 0
 
-        self.ahis = [0]
-        self.alos = [0]
-        self.bhis = [0]
-        self.blos = [0]
-        self.times = [0]
-        self.vouts = [0]
+        ## Switch states are stored edge-encoded: a new entry is only logged when any switch changes state
+        self.switches = ('ahi', 'alo', 'bhi', 'blo')
+        self.state = (0, 0, 0, 0)
+        self.edgetimes = [0]
+        self.edgestates = [self.state]
+        self.edgevouts = [0]
+        self.periodstarts = [0]
         
     def type(self):
         """The `type` method returns the type inverter that this class represents."""
@@ -29,31 +32,102 @@ class FullBridgeIdeal:
         """The `fsw` method in `FullBridgeIdeal` returns the switching frequency of the inverter."""
         return self.fswitch
     
+    def startperiod(self):
+        """The `startperiod` method records the start time of a new PWM period, called by the simulator whenever its PWM timer is reset.
+        Duty cycle and edge jitter statistics are measured against these recorded periods."""
+        self.periodstarts.append(self.time)
+    
     def on(self, ahi, alo, bhi, blo, dt): 
         """The `on` method scales switch commands by bus voltage."""
         self.ahi = ahi
         self.alo = alo
         self.bhi = bhi
         self.blo = blo
-        self.time += dt
 
-        self.ahis.append(ahi)
-        self.alos.append(alo)
-        self.bhis.append(bhi)
-        self.blos.append(blo)
-        self.times.append(self.time)
         if self.ahi > self.bhi:
             self.vout = self.ahi * self.vbus
         elif self.ahi < self.bhi:
             self.vout = self.bhi * self.vbus * -1
         else:
             self.vout = self.ahi + self.bhi
-        self.vouts.append(self.vout)
+
+        ## Only log transitions, PWM signals hold their state for most of each switching period. Edges are stamped at the start
+        #  of the step since the new state is applied over the following `dt`
+        state = (ahi, alo, bhi, blo)
+        if state != self.state or self.vout != self.edgevouts[-1]:
+            self.state = state
+            self.edgetimes.append(self.time)
+            self.edgestates.append(state)
+            self.edgevouts.append(self.vout)
+        self.time += dt
+        self.steps += 1
         return self.vout
         
+    def decode(self, dt=None):
+        """The `decode` method expands the edge-encoded switch log into dense arrays sampled every `dt` seconds, defaulting to the simulation
+        timestep set by the simulator (or the average step, since modified `dt` pairs sum to twice the nominal step). Exact edge times are merged into the time grid so that duty cycle offsets are preserved. Returns a dict of numpy arrays keyed
+        by 'times', 'ahis', 'alos', 'bhis', 'blos' and 'vouts'."""
+        if dt is None:
+            dt = self.dt if self.dt is not None else self.time / self.steps
+        edgetimes = np.asarray(self.edgetimes)
+        edgestates = np.asarray(self.edgestates)
+
+        times = np.union1d(np.arange(0, self.time, dt), edgetimes)
+        times = np.append(times[times < self.time], self.time)
+        idx = np.searchsorted(edgetimes, times, side='right') - 1
+
+        dense = {'times': times}
+        for n, switch in enumerate(self.switches):
+            dense[switch + 's'] = edgestates[idx, n]
+        dense['vouts'] = np.asarray(self.edgevouts)[idx]
+        return dense
+
+    def _ontime(self, switch, t):
+        """The `_ontime` helper integrates the state of `switch` from zero up to each time in `t` directly on the edge-encoded log."""
+        edgetimes = np.asarray(self.edgetimes)
+        states = np.asarray(self.edgestates)[:, self.switches.index(switch)]
+
+        ## Cumulative on-time at every edge, then extend linearly from the last edge before each requested time
+        cumulative = np.concatenate(([0], np.cumsum(states[:-1] * np.diff(edgetimes))))
+        idx = np.searchsorted(edgetimes, t, side='right') - 1
+        return cumulative[idx] + states[idx] * (t - edgetimes[idx])
+
+    def dutycycles(self, switch='ahi'):
+        """The `dutycycles` method returns the actual duty cycle of `switch` for every complete PWM period recorded by `startperiod`."""
+        bounds = np.asarray(self.periodstarts)
+        return np.diff(self._ontime(switch, bounds)) / np.diff(bounds)
+
+    def edges(self, switch='ahi'):
+        """The `edges` method returns the times of the rising and falling edges of `switch`."""
+        edgetimes = np.asarray(self.edgetimes)
+        states = np.asarray(self.edgestates)[:, self.switches.index(switch)]
+        change = np.diff(states)
+        rising = edgetimes[1:][change > 0]
+        falling = edgetimes[1:][change < 0]
+        return rising, falling
+
+    def edgejitter(self, switch='ahi'):
+        """The `edgejitter` method returns the delay of each rising edge of `switch` from the start of the PWM period it falls in. Falling
+        edges move with duty cycle and are not included."""
+        periodstarts = np.asarray(self.periodstarts)
+        rising, _ = self.edges(switch)
+        idx = np.searchsorted(periodstarts, rising, side='right') - 1
+        return rising - periodstarts[idx]
+
+    def switchevents(self):
+        """The `switchevents` method returns a dict with the number of turn-on and turn-off transitions of each switch, which is the number
+        of switching loss events over the simulation."""
+        events = {}
+        for switch in self.switches:
+            rising, falling = self.edges(switch)
+            events[switch] = {'on': len(rising), 'off': len(falling)}
+        return events
+
     def analyze(self, desiredout):
-        """Use argument 'switchplot' to look at the PWM signals on each inverter switch or 'voutplot' to look at the inverter output voltage plot."""
+        """Use argument 'switchplot' to look at the PWM signals on each inverter switch or 'voutplot' to look at the inverter output voltage plot.
+        'dutyplot' plots the actual duty cycle per PWM period, while 'jitter' and 'switchevents' print edge jitter and switching event counts."""
         if desiredout == 'switchplot':
+            dense = self.decode()
             
             fig, axs = plt.subplots(4)
 
@@ -62,16 +136,16 @@ class FullBridgeIdeal:
             axs[2].grid(True)
             axs[3].grid(True)
 
-            axs[0].plot(self.times, self.ahis)
+            axs[0].plot(dense['times'], dense['ahis'])
             axs[0].set_title('Phase A | High Side Switch')
 
-            axs[1].plot(self.times, self.alos)
+            axs[1].plot(dense['times'], dense['alos'])
             axs[1].set_title('Phase A | Low Side Switch')
 
-            axs[2].plot(self.times, self.bhis)
+            axs[2].plot(dense['times'], dense['bhis'])
             axs[2].set_title('Phase B | High Side Switch')
 
-            axs[3].plot(self.times, self.blos)
+            axs[3].plot(dense['times'], dense['blos'])
             axs[3].set_title('Phase B | Low Side Switch')
 
             axs[0].set_ylim([0,1])
@@ -90,13 +164,39 @@ class FullBridgeIdeal:
             plt.show()
         
         if desiredout == 'voutplot':
-            plt.plot(self.times, self.vouts)
+            dense = self.decode()
+            plt.plot(dense['times'], dense['vouts'])
             plt.title('Inverter Output Voltage')
             plt.xlabel('Time (s)')
             plt.ylabel('Voltage')
             plt.grid(True)
             plt.show()
 
+        if desiredout == 'dutyplot':
+            da = self.dutycycles('ahi')
+            db = self.dutycycles('bhi')
+            periods = np.asarray(self.periodstarts[:-1])
+            plt.step(periods, da, where='post', label='Phase A')
+            plt.step(periods, db, where='post', label='Phase B')
+            plt.title('Actual Duty Cycle per PWM Period')
+            plt.xlabel('Time (s)')
+            plt.ylabel('Duty Cycle')
+            plt.legend()
+            plt.grid(True)
+            plt.show()
+
+        if desiredout == 'jitter':
+            for switch in ('ahi', 'bhi'):
+                jitter = self.edgejitter(switch)
+                if len(jitter) == 0:
+                    print(f"{switch} rising edge jitter: no rising edges")
+                else:
+                    print(f"{switch} rising edge jitter: rms = {np.sqrt(np.mean(jitter**2)):.3e} s, peak = {np.max(np.abs(jitter)):.3e} s")
+
+        if desiredout == 'switchevents':
+            for switch, counts in self.switchevents().items():
+                print(f"{switch}: {counts['on']} turn-on, {counts['off']} turn-off events")
+
         
     
 class FullBridgeSimple:
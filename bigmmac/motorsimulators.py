@@ -86,6 +86,7 @@ class ConnectPMDC:
         elif self.inverter.type() == 'FullBridgeIdeal':
             self.timer = 0
             self.ndt = np.trunc((1/self.inverter.fsw()) / self.dt)
+            self.inverter.dt = self.dt
             while self.simstep < self.sim_end:
 
                 # Compute control output
@@ -115,6 +116,7 @@ class ConnectPMDC:
                 # If current simulation step is NOT within a given PWM period, start a new PWM period and compute switch states for all inverter switches
                 else:
                     self.timer = 0
+                    self.inverter.startperiod()
                     if self.da > self.db: # Positive Voltage/Rotation
                         self.timer, self.dt_out, self.ahi = self.idealSwitchGen(self.timer, self.da, self.ndt, self.dt, self.inverter.fsw())
                         self.alo = 0